@@ -1,15 +1,21 @@
-from typing import Union, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Union, Dict, Optional, Sequence, Tuple
 import numpy as np
-import matplotlib.pyplot as plt
 import zarr
-from matplotlib.colors import SymLogNorm
 from astropy.wcs import WCS
 import astropy.units as u
-from astropy.coordinates import SkyCoord
-from sunpy.coordinates import Helioprojective
+from numba import njit
 from .mixin import InversionSlicingMixin
 from .utils import ObjDict
 
+if TYPE_CHECKING:
+    from astropy.coordinates import SkyCoord
+    from matplotlib.axes import Axes
+    from matplotlib.colors import SymLogNorm
+
 rc_context_dict = {
     # "figure.constrained_layout.use" : True,
     # "figure.autolayout" : True,
@@ -21,6 +27,285 @@ rc_context_dict = {
     "font.size": 11,
     "font.serif": "New Century Schoolbook",
 }
+_RC_CONTEXT = MappingProxyType(rc_context_dict)
+
+# The names of the atmospheric quantities in an ObjDict and in a zarr file.
+_ATMOS_KEYS = {
+    "ne": "ne",
+    "temp": "temperature",
+    "vel": "vel",
+    "ne_err": "ne_err",
+    "temp_err": "temperature_err",
+    "vel_err": "vel_err",
+}
+_ZARR_ATMOS_KEYS = {name: "/atmos/" + key for name, key in _ATMOS_KEYS.items()}
+
+# The memory budget for the zarr chunk cache, enough for full-cube atmospheric
+# parameters and their errors.
+_STORE_CACHE_SIZE = 256 * 1024**2
+
+# The cached values computed from the (sliced) WCS, which are dropped when the
+# WCS is reassigned or modified in place.
+_WCS_DERIVED = (
+    "_wcs_snapshot",
+    "_tan_params",
+    "_world_scale",
+    "_to_lonlat_impl",
+    "_from_lonlat_impl",
+    "_lonlat_values",
+)
+
+# The location of the spatial WCS keywords in the two header layouts, as
+# (header key, index into the header value or None).
+_WCS_KEYS_NEW = {
+    "NAXIS1": ("NAXIS1", None),
+    "NAXIS2": ("NAXIS2", None),
+    "CRPIX1": ("CRPIX1", None),
+    "CRPIX2": ("CRPIX2", None),
+    "CRVAL1": ("CRVAL1", None),
+    "CRVAL2": ("CRVAL2", None),
+    "CDELT1": ("CDELT1", None),
+    "CDELT2": ("CDELT2", None),
+}
+_WCS_KEYS_OLD = {
+    "NAXIS1": ("dimensions", -1),
+    "NAXIS2": ("dimensions", -2),
+    "CRPIX1": ("crpix", -1),
+    "CRPIX2": ("crpix", -2),
+    "CRVAL1": ("crval", -1),
+    "CRVAL2": ("crval", -2),
+    "CDELT1": ("pixel_scale", None),
+    "CDELT2": ("pixel_scale", None),
+}
+
+
+def _open_cached_group(filename: str) -> zarr.Group:
+    """
+    Opens a zarr group read-only behind an in-memory LRU chunk cache so that
+    chunks shared by several quantities (or read more than once) are only
+    fetched from the underlying (possibly remote) store once.
+
+    Parameters
+    ----------
+    filename : str
+        The path or URL of the zarr file.
+    """
+    if not hasattr(zarr, "LRUStoreCache"):
+        # the store classes are not available in zarr v3
+        return zarr.open(filename, mode="r")
+
+    # let zarr pick the store (directory, zip, URL, ...) as zarr.open would
+    store = zarr.storage.normalize_store_arg(filename, mode="r")
+    cached = zarr.LRUStoreCache(store, max_size=_STORE_CACHE_SIZE)
+    return zarr.open_group(cached, mode="r")
+
+
+def _as_slice(i: Union[int, slice]) -> slice:
+    """
+    Canonicalises a spatial index of ``Inversion.ind`` for slicing the WCS.
+    Integer indices keep the whole axis so that pixel coordinates along that
+    axis still refer to the full field of view.
+    """
+    return i if isinstance(i, slice) else slice(None)
+
+
+@lru_cache(maxsize=64)
+def _cached_wcs(wcs_items: Tuple) -> WCS:
+    """
+    Builds (and memoises) a WCS from the hashable items of a WCS dictionary.
+    The returned WCS is shared so callers must copy it before handing it out.
+    """
+    return WCS(dict(wcs_items))
+
+
+def _wrap_arcsec(lon: np.ndarray) -> np.ndarray:
+    """
+    Wraps longitudes in arcseconds to [-180, 180) degrees, the range used by
+    Helioprojective coordinates.
+    """
+    return (lon + 648000) % 1296000 - 648000
+
+
+@njit(cache=True)
+def _tan_pix2world(px, py, crpix, crval, cd):
+    """
+    Gnomonic (TAN) pixel to world transformation (Calabretta & Greisen 2002)
+    for a celestial WCS with the default native longitude of the celestial pole
+    of 180 degrees.
+
+    Parameters
+    ----------
+    px : numpy.ndarray
+        1D array of the 0-based pixel coordinates along the longitude axis.
+    py : numpy.ndarray
+        1D array of the 0-based pixel coordinates along the latitude axis.
+    crpix : numpy.ndarray
+        The 0-based reference pixel.
+    crval : numpy.ndarray
+        The world coordinates of the reference pixel in degrees.
+    cd : numpy.ndarray
+        The 2x2 linear transformation matrix in degrees per pixel.
+
+    Returns
+    -------
+    lon : numpy.ndarray
+        The longitudes in degrees.
+    lat : numpy.ndarray
+        The latitudes in degrees.
+    """
+    lon = np.empty_like(px)
+    lat = np.empty_like(py)
+    a0, d0 = np.radians(crval[0]), np.radians(crval[1])
+    sin_d0, cos_d0 = np.sin(d0), np.cos(d0)
+    for i in range(px.shape[0]):
+        dx, dy = px[i] - crpix[0], py[i] - crpix[1]
+        x = np.radians(cd[0, 0] * dx + cd[0, 1] * dy)
+        y = np.radians(cd[1, 0] * dx + cd[1, 1] * dy)
+        # native spherical coordinates, rotated by the pole longitude of 180
+        phi = np.arctan2(x, -y) - np.pi
+        theta = np.arctan2(1.0, np.hypot(x, y))
+        sin_t, cos_t = np.sin(theta), np.cos(theta)
+        lon[i] = np.degrees(
+            a0
+            + np.arctan2(
+                -cos_t * np.sin(phi), sin_t * cos_d0 - cos_t * sin_d0 * np.cos(phi)
+            )
+        )
+        lat[i] = np.degrees(np.arcsin(sin_t * sin_d0 + cos_t * cos_d0 * np.cos(phi)))
+
+    return lon, lat
+
+
+@njit(cache=True)
+def _tan_world2pix(lon, lat, crpix, crval, cd_inv):
+    """
+    Gnomonic (TAN) world to pixel transformation, the inverse of
+    ``_tan_pix2world``.
+
+    Parameters
+    ----------
+    lon : numpy.ndarray
+        1D array of the longitudes in degrees.
+    lat : numpy.ndarray
+        1D array of the latitudes in degrees.
+    crpix : numpy.ndarray
+        The 0-based reference pixel.
+    crval : numpy.ndarray
+        The world coordinates of the reference pixel in degrees.
+    cd_inv : numpy.ndarray
+        The inverse of the 2x2 linear transformation matrix.
+
+    Returns
+    -------
+    px : numpy.ndarray
+        The 0-based pixel coordinates along the longitude axis. Points on the
+        far hemisphere, which have no projection, are NaN.
+    py : numpy.ndarray
+        The 0-based pixel coordinates along the latitude axis.
+    """
+    px = np.empty_like(lon)
+    py = np.empty_like(lat)
+    a0, d0 = np.radians(crval[0]), np.radians(crval[1])
+    sin_d0, cos_d0 = np.sin(d0), np.cos(d0)
+    for i in range(lon.shape[0]):
+        da, d = np.radians(lon[i]) - a0, np.radians(lat[i])
+        sin_d, cos_d = np.sin(d), np.cos(d)
+        sin_t = sin_d * sin_d0 + cos_d * cos_d0 * np.cos(da)
+        if sin_t <= 0.0:
+            px[i], py[i] = np.nan, np.nan
+            continue
+        phi = np.arctan2(
+            -cos_d * np.sin(da), sin_d * cos_d0 - cos_d * sin_d0 * np.cos(da)
+        )
+        r = np.sqrt(1.0 - sin_t * sin_t) / sin_t
+        # the pole longitude of 180 flips the signs of sin(phi) and cos(phi)
+        x, y = np.degrees(-r * np.sin(phi)), np.degrees(r * np.cos(phi))
+        px[i] = cd_inv[0, 0] * x + cd_inv[0, 1] * y + crpix[0]
+        py[i] = cd_inv[1, 0] * x + cd_inv[1, 1] * y + crpix[1]
+
+    return px, py
+
+
+def _fits_wcs(ll_wcs) -> Tuple[Optional[WCS], Optional[Tuple]]:
+    """
+    Finds the FITS WCS underlying a (possibly sliced) low-level WCS.
+
+    Parameters
+    ----------
+    ll_wcs : astropy.wcs.wcsapi.BaseLowLevelWCS
+        The WCS to inspect.
+
+    Returns
+    -------
+    base : astropy.wcs.WCS or None
+        The underlying FITS WCS, or ``None`` if there is not one.
+    slices : tuple or None
+        The array index of ``base`` that ``ll_wcs`` represents.
+    """
+    if isinstance(ll_wcs, WCS):
+        return ll_wcs, (slice(None),) * ll_wcs.naxis
+    base = getattr(ll_wcs, "_wcs", None)
+    slices = getattr(ll_wcs, "_slices_array", None)
+    if not isinstance(base, WCS) or slices is None:
+        return None, None
+    return base, slices
+
+
+def _celestial_tan_params(wcs) -> Optional[Tuple[np.ndarray, ...]]:
+    """
+    Extracts the parameters needed by ``_tan_pix2world`` and
+    ``_tan_world2pix`` from a two dimensional (possibly sliced) celestial WCS.
+
+    Parameters
+    ----------
+    wcs : astropy.wcs.WCS or astropy.wcs.wcsapi.BaseLowLevelWCS
+        The WCS to inspect.
+
+    Returns
+    -------
+    tuple[numpy.ndarray] or None
+        The 0-based reference pixel, the reference world coordinates in
+        degrees, the linear transformation matrix and its inverse. ``None`` if
+        the WCS is not a plain, separable gnomonic projection in degrees, in
+        which case the conversion must be left to astropy.
+    """
+    ll_wcs = getattr(wcs, "low_level_wcs", wcs)
+    if ll_wcs.pixel_n_dim != 2 or ll_wcs.world_n_dim != 2:
+        return None
+    base, slices = _fits_wcs(ll_wcs)
+    if base is None:
+        return None
+
+    lng, lat = base.wcs.lng, base.wcs.lat
+    if lng < 0 or lat < lng or base.has_distortion:
+        return None
+    # the celestial axes must not depend on any of the other pixel axes
+    others = [i for i in range(base.naxis) if i not in (lng, lat)]
+    if base.axis_correlation_matrix[np.ix_([lng, lat], others)].any():
+        return None
+
+    starts = []
+    for axis in (lng, lat):
+        s = slices[base.naxis - 1 - axis]
+        if not isinstance(s, slice) or s.step not in (None, 1):
+            return None
+        if s.start is not None and s.start < 0:
+            return None
+        starts.append(s.start or 0)
+
+    cel = base.sub([lng + 1, lat + 1])
+    cel.wcs.set()
+    if not all(c.endswith("-TAN") for c in cel.wcs.ctype):
+        return None
+    if cel.wcs.get_pv() or cel.wcs.lonpole != 180:
+        return None
+    if any(c != "deg" for c in cel.wcs.cunit):
+        return None
+
+    crpix = cel.wcs.crpix - 1 - np.array(starts, dtype=np.float64)
+    crval = np.array(cel.wcs.crval, dtype=np.float64)
+    cd = cel.wcs.get_cdelt()[:, None] * cel.wcs.get_pc()
+    return crpix, crval, cd, np.linalg.inv(cd)
 
 
 class Inversion(InversionSlicingMixin):
@@ -33,7 +318,8 @@ class Inversion(InversionSlicingMixin):
         The file of the inversion. Can be either a zarr file path or a
         ``crispy.utils.ObjDict`` object.
     header : dict
-        The header information of the associated observation.
+        The header information of the associated observation. This should not
+        be modified after the ``Inversion`` is created.
     z : str or numpy.ndarray or None, optional
         The height grid that the atmospheric parameters are calculated at. This
         can be either a zarr file path or a numpy.ndarray. Defaults to None
@@ -52,14 +338,17 @@ class Inversion(InversionSlicingMixin):
         z: Optional[Union[str, np.ndarray]] = None,
         wcs: Optional[WCS] = None,
     ) -> None:
+        self._cache = {}
+        self._vel_norm = None
         if isinstance(filename, str):
-            self.f = zarr.open(filename, mode="r")
+            self.f = _open_cached_group(filename)
             if isinstance(z, str):
                 self.z = zarr.open(z, mode="r")["z"][:]
             elif z is None:
                 self.z = self.f["/atmos/z"]
             else:
                 self.z = z
+            self._init_z()
             if wcs is None:
                 self.wcs = self._inversion_wcs(header)
             else:
@@ -73,146 +362,220 @@ class Inversion(InversionSlicingMixin):
                 self.z = filename["z"]
             else:
                 self.z = z
+            self._init_z()
             if wcs is None:
                 self.wcs = self._inversion_wcs(header)
             else:
                 self.wcs = wcs
             self.header = header
 
+        if isinstance(self.f, ObjDict):
+            self._keys = _ATMOS_KEYS
+        else:
+            self._keys = _ZARR_ATMOS_KEYS
+
+        date_avg = header.get("DATE-AVG")
+        if date_avg is not None:
+            self._datetime_str = date_avg
+            self._date, _, self._time = date_avg.partition("T")
+        else:
+            self._datetime_str = header["date_obs"] + "T" + header["time_obs"]
+            self._date, self._time = header["date_obs"], header["time_obs"]
+        if "CRVAL1" in header:
+            self._pointing_x = str(header["CRVAL1"])
+            self._pointing_y = str(header["CRVAL2"])
+        else:
+            self._pointing_x = str(header["crval"][-1])
+            self._pointing_y = str(header["crval"][-2])
+
+    def _init_z(self) -> None:
+        """
+        Reads the height grid into memory once (it may be a zarr array) and
+        precomputes the quantities derived from it that are used for the WCS
+        and plot titles.
+        """
+        if np.ndim(self.z) == 0:
+            # a single height (sliced object) does not need the ndarray machinery
+            self._z_rounded = round(float(self.z), 4)
+        else:
+            if not isinstance(self.z, np.ndarray):
+                self.z = np.asarray(self.z)
+            self._z_rounded = np.round(self.z, decimals=4)
+            self._z_mid_idx = int(self.z.shape[0] // 2)
+            self._z_mid_val = self.z[self._z_mid_idx]
+
+    def _atmos(self, name: str) -> np.ndarray:
+        """
+        Reads an atmospheric quantity in a single full-extent fetch and caches
+        the resulting ``numpy.ndarray`` so that repeated access (e.g. plotting)
+        never goes back through the zarr decoder.
+
+        Parameters
+        ----------
+        name : str
+            The name of the quantity e.g. "ne", "temp_err".
+        """
+        if name not in self._cache:
+            self._cache[name] = np.asarray(self.f[self._keys[name]][...])
+        return self._cache[name]
+
+    def _atmos_slice(self, name: str, item: Union[int, Sequence]) -> np.ndarray:
+        """
+        Returns a slice of an atmospheric quantity. If the quantity has not been
+        read into memory, the selection is made by zarr, which only reads the
+        chunks the slice touches, rather than reading the full array.
+
+        Parameters
+        ----------
+        name : str
+            The name of the quantity e.g. "ne", "temp_err".
+        item : int or tuple
+            The index into the quantity.
+        """
+        if name in self._cache or isinstance(self.f, ObjDict):
+            return self._atmos(name)[item]
+
+        return np.asarray(self.f[self._keys[name]][item])
+
+    def _prefetch(self, *names: str) -> Tuple[np.ndarray, ...]:
+        """
+        Returns the requested atmospheric quantities, reading any that are not
+        yet cached from the zarr file concurrently. Chunk fetches and decoding
+        release the GIL so for remote stores the reads overlap rather than
+        waiting on each round-trip in turn. Quantities read together that share
+        a shape and dtype are stored side by side in one contiguous block, each
+        cached as a contiguous view into it.
+
+        Parameters
+        ----------
+        names : str
+            The names of the properties to fetch e.g. "ne", "temp_err".
+        """
+        pending = [name for name in names if name not in self._cache]
+        if len(pending) > 1 and not isinstance(self.f, ObjDict):
+            arrs = [self.f[self._keys[name]] for name in pending]
+            if len({(arr.shape, arr.dtype) for arr in arrs}) == 1:
+                block = np.empty((len(arrs),) + arrs[0].shape, dtype=arrs[0].dtype)
+
+                def read(i: int) -> None:
+                    block[i] = arrs[i][...]
+
+                with ThreadPoolExecutor(max_workers=len(arrs)) as ex:
+                    list(ex.map(read, range(len(arrs))))
+                for name, view in zip(pending, block):
+                    self._cache[name] = view
+            else:
+                with ThreadPoolExecutor(max_workers=len(pending)) as ex:
+                    futures = [ex.submit(getattr, self, name) for name in pending]
+                    for fut in futures:
+                        fut.result()
+        return tuple(getattr(self, name) for name in names)
+
+    def _velocity_norm(self) -> "SymLogNorm":
+        """
+        Returns the symmetric log norm for the velocity maps. The limits are set
+        explicitly from a single scan of the velocities so matplotlib does not
+        autoscale the norm on every plot.
+        """
+        from matplotlib.colors import SymLogNorm
+
+        if self._vel_norm is None:
+            vel = self.vel
+            self._vel_norm = SymLogNorm(
+                linthresh=1, vmin=float(np.nanmin(vel)), vmax=float(np.nanmax(vel))
+            )
+        return self._vel_norm
+
     @property
     def ne(self):
         """
         Returns the electron number density in the inversion.
         """
-        if isinstance(self.f, ObjDict):
-            return self.f["ne"]
-        else:
-            return self.f["/atmos/ne"]
+        return self._atmos("ne")
 
     @property
     def temp(self):
         """
         Returns the electron temperature in the inversion.
         """
-        if isinstance(self.f, ObjDict):
-            return self.f["temperature"]
-        else:
-            return self.f["/atmos/temperature"]
+        return self._atmos("temp")
 
     @property
     def vel(self):
         """
         Returns the bulk velocity flow in the inversion.
         """
-        if isinstance(self.f, ObjDict):
-            return self.f["vel"]
-        else:
-            return self.f["/atmos/vel"]
+        return self._atmos("vel")
 
     @property
     def ne_err(self):
         """
         Returns the errors on the electron number density.
         """
-        if isinstance(self.f, ObjDict):
-            return self.f["ne_err"]
-        else:
-            return self.f["/atmos/ne_err"]
+        return self._atmos("ne_err")
 
     @property
     def temp_err(self):
         """
         Returns the errors on the electron temperature.
         """
-        if isinstance(self.f, ObjDict):
-            return self.f["temperature_err"]
-        else:
-            return self.f["/atmos/temperature_err"]
+        return self._atmos("temp_err")
 
     @property
     def vel_err(self):
         """
         Returns the errors on the bulk velocity flow.
         """
-        if isinstance(self.f, ObjDict):
-            return self.f["vel_err"]
-        else:
-            return self.f["/atmos/vel_err"]
+        return self._atmos("vel_err")
 
     def __str__(self) -> str:
-        try:
-            time = self.header["DATE-AVG"][-12:]
-            date = self.header["DATE-AVG"][:-13]
-            pointing_x = str(self.header["CRVAL1"])
-            pointing_y = str(self.header["CRVAL2"])
-        except KeyError:
-            time = self.header["time_obs"]
-            date = self.header["date_obs"]
-            pointing_x = str(self.header["crval"][-1])
-            pointing_y = str(self.header["crval"][-2])
-
         return f"""Inversion
         ------------------
-        {date} {time}
+        {self._date} {self._time}
 
-        Pointing: ({pointing_x}, {pointing_y})"""
+        Pointing: ({self._pointing_x}, {self._pointing_y})"""
 
     def _inversion_wcs(self, header: Dict) -> WCS:
+        scheme = "new" if "NAXIS1" in header else "old"
+        wcs_items = tuple(self._build_wcs_dict(header, scheme).items())
+        # each instance gets its own copy so in-place edits stay local to it
+        return _cached_wcs(wcs_items).deepcopy()
 
-        wcs_dict = {}
-
-        try:
-            wcs_dict["NAXIS1"] = header["NAXIS1"]
-            wcs_dict["NAXIS2"] = header["NAXIS2"]
-            wcs_dict["NAXIS3"] = self.z.shape[0]
-
-            wcs_dict["CTYPE1"] = "HPLN-TAN"
-            wcs_dict["CTYPE2"] = "HPLT-TAN"
-            wcs_dict["CTYPE3"] = "HEIGHT"
-
-            wcs_dict["CUNIT1"] = "arcsec"
-            wcs_dict["CUNIT2"] = "arcsec"
-            wcs_dict["CUNIT3"] = "Mm"
-
-            wcs_dict["CRPIX1"] = header["CRPIX1"]
-            wcs_dict["CRPIX2"] = header["CRPIX2"]
-            wcs_dict["CRPIX3"] = self.z.shape[0] // 2
-
-            wcs_dict["CRVAL1"] = header["CRVAL1"]
-            wcs_dict["CRVAL2"] = header["CRVAL2"]
-            wcs_dict["CRVAL3"] = self.z[self.z.shape[0] // 2]
+    def _build_wcs_dict(self, header: Dict, scheme: str) -> Dict:
+        """
+        Builds the WCS keywords for the inversion from the observation header.
 
-            wcs_dict["CDELT1"] = header["CDELT1"]
-            wcs_dict["CDELT2"] = header["CDELT2"]
-            wcs_dict["CDELT3"] = 1.0  # z is sampled non-uniformly
-        except KeyError:
-            wcs_dict["NAXIS1"] = header["dimensions"][-1]
-            wcs_dict["NAXIS2"] = header["dimensions"][-2]
-            wcs_dict["NAXIS3"] = self.z.shape[0]
+        Parameters
+        ----------
+        header : dict
+            The header information of the associated observation.
+        scheme : str
+            The layout of the header, "new" for FITS-style keywords or "old" for
+            the older zarr header (see ``_WCS_KEYS_NEW`` and ``_WCS_KEYS_OLD``).
+        """
+        keys = _WCS_KEYS_NEW if scheme == "new" else _WCS_KEYS_OLD
 
-            wcs_dict["CTYPE1"] = "HPLN-TAN"
-            wcs_dict["CTYPE2"] = "HPLT-TAN"
-            wcs_dict["CTYPE3"] = "HEIGHT"
+        wcs_dict = {}
+        for wcs_key, (header_key, idx) in keys.items():
+            value = header[header_key]
+            wcs_dict[wcs_key] = value if idx is None else value[idx]
 
-            wcs_dict["CUNIT1"] = "arcsec"
-            wcs_dict["CUNIT2"] = "arcsec"
-            wcs_dict["CUNIT3"] = "Mm"
+        wcs_dict["NAXIS3"] = self.z.shape[0]
 
-            wcs_dict["CRPIX1"] = header["crpix"][-1]
-            wcs_dict["CRPIX2"] = header["crpix"][-2]
-            wcs_dict["CRPIX3"] = self.z.shape[0] // 2
+        wcs_dict["CTYPE1"] = "HPLN-TAN"
+        wcs_dict["CTYPE2"] = "HPLT-TAN"
+        wcs_dict["CTYPE3"] = "HEIGHT"
 
-            wcs_dict["CRVAL1"] = header["crval"][-1]
-            wcs_dict["CRVAL2"] = header["crval"][-2]
-            wcs_dict["CRVAL3"] = self.z[self.z.shape[0] // 2]
+        wcs_dict["CUNIT1"] = "arcsec"
+        wcs_dict["CUNIT2"] = "arcsec"
+        wcs_dict["CUNIT3"] = "Mm"
 
-            wcs_dict["CDELT1"] = header["pixel_scale"]
-            wcs_dict["CDELT2"] = header["pixel_scale"]
-            wcs_dict["CDELT3"] = 1.0  # z is sampled non-uniformly
+        wcs_dict["CRPIX3"] = self._z_mid_idx
+        wcs_dict["CRVAL3"] = self._z_mid_val
+        wcs_dict["CDELT3"] = 1.0  # z is sampled non-uniformly
 
-        return WCS(wcs_dict)
+        return wcs_dict
 
-    @plt.rc_context(rc_context_dict)
     def plot_ne(self, eb: bool = False) -> None:
         """
         Class method to plot the electron number density for a given location
@@ -225,24 +588,21 @@ class Inversion(InversionSlicingMixin):
             Whether or not to plot the median absolute deviation (MAD) for the
             electron number density as errorbars. Default is False.
         """
-        try:
-            datetime = self.header["DATE-AVG"]
-        except KeyError:
-            datetime = self.header["date_obs"] + "T" + self.header["time_obs"]
+        import matplotlib.pyplot as plt
 
-        title = f"{datetime}"
-        fig = plt.figure()
-        ax1 = fig.gca()
-        if eb:
-            ax1.errorbar(self.z, self.ne, yerr=self.ne_err, capsize=3)
-        else:
-            ax1.plot(self.z, self.ne)
-        ax1.set_ylabel(r"log$_{10}$ n$_{\text{e}}$ \[cm$^{-3}$\]")
-        ax1.set_xlabel("z [Mm]")
-        ax1.set_title(f"Electron Number Density {title}")
-        fig.show()
+        title = self._datetime_str
+        with plt.rc_context(_RC_CONTEXT):
+            fig = plt.figure()
+            ax1 = fig.gca()
+            if eb:
+                ax1.errorbar(self.z, self.ne, yerr=self.ne_err, capsize=3)
+            else:
+                ax1.plot(self.z, self.ne)
+            ax1.set_ylabel(r"log$_{10}$ n$_{\text{e}}$ \[cm$^{-3}$\]")
+            ax1.set_xlabel("z [Mm]")
+            ax1.set_title(f"Electron Number Density {title}")
+            fig.show()
 
-    @plt.rc_context(rc_context_dict)
     def plot_temp(self, eb: bool = False) -> None:
         """
         Class method to plot the electron temperature for a given point in the
@@ -254,24 +614,21 @@ class Inversion(InversionSlicingMixin):
             Whether or not to plot the median absolute deviation (MAD) of the
             estimated electron temperatures as errorbars. Default is False.
         """
-        try:
-            datetime = self.header["DATE-AVG"]
-        except KeyError:
-            datetime = self.header["date_obs"] + "T" + self.header["time_obs"]
+        import matplotlib.pyplot as plt
 
-        title = f"{datetime}"
-        fig = plt.figure()
-        ax1 = fig.gca()
-        if eb:
-            ax1.errorbar(self.z, self.temp, yerr=self.temp_err, capsize=3)
-        else:
-            ax1.plot(self.z, self.temp)
-        ax1.set_ylabel(r"log$_{10}$ T \[K\]")
-        ax1.set_xlabel("z [Mm]")
-        ax1.set_title(f"Electron Temperature {title}")
-        fig.show()
+        title = self._datetime_str
+        with plt.rc_context(_RC_CONTEXT):
+            fig = plt.figure()
+            ax1 = fig.gca()
+            if eb:
+                ax1.errorbar(self.z, self.temp, yerr=self.temp_err, capsize=3)
+            else:
+                ax1.plot(self.z, self.temp)
+            ax1.set_ylabel(r"log$_{10}$ T \[K\]")
+            ax1.set_xlabel("z [Mm]")
+            ax1.set_title(f"Electron Temperature {title}")
+            fig.show()
 
-    @plt.rc_context(rc_context_dict)
     def plot_vel(self, eb: bool = False) -> None:
         """
         Class method to plot the bulk velocity for a certain point within the
@@ -283,24 +640,21 @@ class Inversion(InversionSlicingMixin):
             Whether or not to plot the median absolute deviation (MAD) of the
             bulk velocity as errorbars. Default is False.
         """
-        try:
-            datetime = self.header["DATE-AVG"]
-        except KeyError:
-            datetime = self.header["date_obs"] + "T" + self.header["time_obs"]
+        import matplotlib.pyplot as plt
 
-        title = f"{datetime}"
-        fig = plt.figure()
-        ax1 = fig.gca()
-        if eb:
-            ax1.errorbar(self.z, self.vel, yerr=self.vel_err, capsize=3)
-        else:
-            ax1.plot(self.z, self.vel)
-        ax1.set_ylabel(r"Bulk Plasma Flow \[km s$^{-1}$\]")
-        ax1.set_xlabel("z [Mm]")
-        ax1.set_title(f"Bulk Plasma Flow {title}")
-        fig.show()
+        title = self._datetime_str
+        with plt.rc_context(_RC_CONTEXT):
+            fig = plt.figure()
+            ax1 = fig.gca()
+            if eb:
+                ax1.errorbar(self.z, self.vel, yerr=self.vel_err, capsize=3)
+            else:
+                ax1.plot(self.z, self.vel)
+            ax1.set_ylabel(r"Bulk Plasma Flow \[km s$^{-1}$\]")
+            ax1.set_xlabel("z [Mm]")
+            ax1.set_title(f"Bulk Plasma Flow {title}")
+            fig.show()
 
-    @plt.rc_context(rc_context_dict)
     def plot_params(self, eb: bool = False) -> None:
         """
         Class method to plot the electron number density, electron temperature,
@@ -313,44 +667,48 @@ class Inversion(InversionSlicingMixin):
             Whether or not to plot the median absolute deviation (MAD) for each
             estimated quantity as errorbars. Default is False.
         """
-        try:
-            datetime = self.header["DATE-AVG"]
-        except KeyError:
-            datetime = self.header["date_obs"] + "T" + self.header["time_obs"]
+        import matplotlib.pyplot as plt
 
-        title = f"{datetime}"
-        fig = plt.figure()
-        fig.suptitle(title)
-        ax1 = fig.add_subplot(1, 3, 1)
         if eb:
-            ax1.errorbar(self.z, self.ne, yerr=self.ne_err, capsize=3)
+            ne, temp, vel, ne_err, temp_err, vel_err = self._prefetch(
+                "ne", "temp", "vel", "ne_err", "temp_err", "vel_err"
+            )
         else:
-            ax1.plot(self.z, self.ne)
-        ax1.set_ylabel(r"log$_{10}$ n$_{e}$ \[cm$^{-3}$\]")
-        ax1.set_xlabel("z [Mm]")
-        ax1.set_title("Electron Number Density")
+            ne, temp, vel = self._prefetch("ne", "temp", "vel")
 
-        ax2 = fig.add_subplot(1, 3, 2)
-        if eb:
-            ax2.errorbar(self.z, self.temp, yerr=self.temp_err, capsize=3)
-        else:
-            ax2.plot(self.z, self.temp)
-        ax2.set_ylabel(r"log$_{10}$ T \[K\]")
-        ax2.set_xlabel("z [Mm]")
-        ax2.set_title("Electron Temperature")
+        title = self._datetime_str
+        with plt.rc_context(_RC_CONTEXT):
+            fig = plt.figure()
+            fig.suptitle(title)
+            ax1 = fig.add_subplot(1, 3, 1)
+            if eb:
+                ax1.errorbar(self.z, ne, yerr=ne_err, capsize=3)
+            else:
+                ax1.plot(self.z, ne)
+            ax1.set_ylabel(r"log$_{10}$ n$_{e}$ \[cm$^{-3}$\]")
+            ax1.set_xlabel("z [Mm]")
+            ax1.set_title("Electron Number Density")
 
-        ax3 = fig.add_subplot(1, 3, 3)
-        if eb:
-            ax3.errorbar(self.z, self.vel, yerr=self.vel_err, capsize=3)
-        else:
-            ax3.plot(self.z, self.vel)
-        ax3.set_ylabel(r"Bulk Plasma Flow \[km s$^{-1}\]")
-        ax3.set_xlabel("z [Mm]")
-        ax3.set_title("Bulk Plasma Flow")
-        fig.show()
+            ax2 = fig.add_subplot(1, 3, 2)
+            if eb:
+                ax2.errorbar(self.z, temp, yerr=temp_err, capsize=3)
+            else:
+                ax2.plot(self.z, temp)
+            ax2.set_ylabel(r"log$_{10}$ T \[K\]")
+            ax2.set_xlabel("z [Mm]")
+            ax2.set_title("Electron Temperature")
 
-    @plt.rc_context(rc_context_dict)
-    def ne_map(self, frame: Optional[str] = None) -> None:
+            ax3 = fig.add_subplot(1, 3, 3)
+            if eb:
+                ax3.errorbar(self.z, vel, yerr=vel_err, capsize=3)
+            else:
+                ax3.plot(self.z, vel)
+            ax3.set_ylabel(r"Bulk Plasma Flow \[km s$^{-1}\]")
+            ax3.set_xlabel("z [Mm]")
+            ax3.set_title("Bulk Plasma Flow")
+            fig.show()
+
+    def ne_map(self, frame: Optional[str] = None, ax: Optional["Axes"] = None) -> None:
         """
         Creates an electron density map at a specified height denoted in the
         ``Inversion`` slice.
@@ -360,34 +718,48 @@ class Inversion(InversionSlicingMixin):
         frame : str, optional
             The frame to plot the map in. Default is None therefore uses the WCS
             frame. Other option is "pix" to plot in the pixel frame.
+        ax : matplotlib.axes.Axes, optional
+            An axes already showing a map from this method (e.g. for another
+            height). If given, the image in it is updated in place rather than
+            building a new figure. Default is None.
         """
-        height = np.round(self.z, decimals=4)
-        try:
-            datetime = self.header["DATE-AVG"]
-        except KeyError:
-            datetime = self.header["date_obs"] + "T" + self.header["time_obs"]
+        import matplotlib.pyplot as plt
 
-        if frame is None:
-            fig = plt.figure()
-            ax1 = fig.add_subplot(1, 1, 1, projection=self.wcs.low_level_wcs)
-            im1 = ax1.imshow(self.ne, cmap="cividis")
-            ax1.set_ylabel("Helioprojective Latitude [arcsec]")
-            ax1.set_xlabel("Helioprojective Longitude [arcsec]")
-            ax1.set_title(f"Electron Number Density {datetime} z={height}Mm")
-            fig.colorbar(im1, ax=ax1, label=r"log$_{10}$n$_{e}$ [cm$^{-3}$]")
-            fig.show()
-        else:
-            fig = plt.figure()
-            ax1 = fig.gca()
-            im1 = ax1.imshow(self.ne, cmap="cividis")
-            ax1.set_ylabel("y [pixels]")
-            ax1.set_xlabel("x [pixels]")
-            ax1.set_title(f"Electron Number Density {datetime} z={height}Mm")
-            fig.colorbar(im1, ax=ax1, label=r"log$_{10}$n$_{e}$ [cm$^{-3}$]")
-            fig.show()
+        height = self._z_rounded
+        datetime = self._datetime_str
+        ne = np.asarray(self.ne, dtype=np.float32)
 
-    @plt.rc_context(rc_context_dict)
-    def temp_map(self, frame: Optional[str] = None) -> None:
+        if ax is not None and ax.images:
+            im = ax.images[0]
+            im.set_data(ne)
+            im.autoscale()
+            ax.set_title(f"Electron Number Density {datetime} z={height}Mm")
+            ax.figure.canvas.draw_idle()
+            return
+
+        with plt.rc_context(_RC_CONTEXT):
+            if frame is None:
+                fig = plt.figure()
+                ax1 = fig.add_subplot(1, 1, 1, projection=self.wcs.low_level_wcs)
+                im1 = ax1.imshow(ne, cmap="cividis")
+                ax1.set_ylabel("Helioprojective Latitude [arcsec]")
+                ax1.set_xlabel("Helioprojective Longitude [arcsec]")
+                ax1.set_title(f"Electron Number Density {datetime} z={height}Mm")
+                fig.colorbar(im1, ax=ax1, label=r"log$_{10}$n$_{e}$ [cm$^{-3}$]")
+                fig.show()
+            else:
+                fig = plt.figure()
+                ax1 = fig.gca()
+                im1 = ax1.imshow(ne, cmap="cividis")
+                ax1.set_ylabel("y [pixels]")
+                ax1.set_xlabel("x [pixels]")
+                ax1.set_title(f"Electron Number Density {datetime} z={height}Mm")
+                fig.colorbar(im1, ax=ax1, label=r"log$_{10}$n$_{e}$ [cm$^{-3}$]")
+                fig.show()
+
+    def temp_map(
+        self, frame: Optional[str] = None, ax: Optional["Axes"] = None
+    ) -> None:
         """
         Creates an electron temperature map at a specified height denoted in the
         ``Inversion`` slice.
@@ -397,33 +769,45 @@ class Inversion(InversionSlicingMixin):
         frame : str, optional
             The frame to plot the map in. Default is None therefore uses the WCS
             frame. Other option is "pix" to plot in the pixel frame.
+        ax : matplotlib.axes.Axes, optional
+            An axes already showing a map from this method (e.g. for another
+            height). If given, the image in it is updated in place rather than
+            building a new figure. Default is None.
         """
-        height = np.round(self.z, decimals=4)
-        try:
-            datetime = self.header["DATE-AVG"]
-        except KeyError:
-            datetime = self.header["date_obs"] + "T" + self.header["time_obs"]
-        if frame is None:
-            fig = plt.figure()
-            ax1 = fig.add_subplot(1, 1, 1, projection=self.wcs.low_level_wcs)
-            im1 = ax1.imshow(self.temp, cmap="hot")
-            ax1.set_ylabel("Helioprojective Latitude [arcsec]")
-            ax1.set_xlabel("Helioprojective Longitude [arcsec]")
-            ax1.set_title(f"Electron Temperature {datetime} z={height}Mm")
-            fig.colorbar(im1, ax=ax1, label=r"log$_{10}$T [K]")
-            fig.show()
-        else:
-            fig = plt.figure()
-            ax1 = fig.gca()
-            im1 = ax1.imshow(self.temp, cmap="cividis")
-            ax1.set_ylabel("y [pixels]")
-            ax1.set_xlabel("x [pixels]")
-            ax1.set_title(f"Electron Temperature {datetime} z={height}Mm")
-            fig.colorbar(im1, ax=ax1, label=r"log$_{10}$T [K]")
-            fig.show()
+        import matplotlib.pyplot as plt
+
+        height = self._z_rounded
+        datetime = self._datetime_str
+        temp = np.asarray(self.temp, dtype=np.float32)
+
+        if ax is not None and ax.images:
+            im = ax.images[0]
+            im.set_data(temp)
+            im.autoscale()
+            ax.set_title(f"Electron Temperature {datetime} z={height}Mm")
+            ax.figure.canvas.draw_idle()
+            return
+        with plt.rc_context(_RC_CONTEXT):
+            if frame is None:
+                fig = plt.figure()
+                ax1 = fig.add_subplot(1, 1, 1, projection=self.wcs.low_level_wcs)
+                im1 = ax1.imshow(temp, cmap="hot")
+                ax1.set_ylabel("Helioprojective Latitude [arcsec]")
+                ax1.set_xlabel("Helioprojective Longitude [arcsec]")
+                ax1.set_title(f"Electron Temperature {datetime} z={height}Mm")
+                fig.colorbar(im1, ax=ax1, label=r"log$_{10}$T [K]")
+                fig.show()
+            else:
+                fig = plt.figure()
+                ax1 = fig.gca()
+                im1 = ax1.imshow(temp, cmap="cividis")
+                ax1.set_ylabel("y [pixels]")
+                ax1.set_xlabel("x [pixels]")
+                ax1.set_title(f"Electron Temperature {datetime} z={height}Mm")
+                fig.colorbar(im1, ax=ax1, label=r"log$_{10}$T [K]")
+                fig.show()
 
-    @plt.rc_context(rc_context_dict)
-    def vel_map(self, frame: Optional[str] = None) -> None:
+    def vel_map(self, frame: Optional[str] = None, ax: Optional["Axes"] = None) -> None:
         """
         Creates a bulk velocity map at a specified height denoted in the
         ``Inversion`` slice.
@@ -433,32 +817,44 @@ class Inversion(InversionSlicingMixin):
         frame : str, optional
             The frame to plot the map in. Default is None therefore uses the WCS
             frame. Other option is "pix" to plot in the pixel frame.
+        ax : matplotlib.axes.Axes, optional
+            An axes already showing a map from this method (e.g. for another
+            height). If given, the image in it is updated in place rather than
+            building a new figure. Default is None.
         """
-        height = np.round(self.z, decimals=4)
-        try:
-            datetime = self.header["DATE-AVG"]
-        except KeyError:
-            datetime = self.header["date_obs"] + "T" + self.header["time_obs"]
-        if frame is None:
-            fig = plt.figure()
-            ax1 = fig.add_subplot(1, 1, 1, projection=self.wcs.low_level_wcs)
-            im1 = ax1.imshow(self.vel, cmap="RdBu", norm=SymLogNorm(1))
-            ax1.set_ylabel("Helioprojective Latitude [arcsec]")
-            ax1.set_xlabel("Helioprojective Longitude [arcsec]")
-            ax1.set_title(f"Bulk Velocity Flow {datetime} z={height}Mm")
-            fig.colorbar(im1, ax=ax1, label=r"v [kms$^{-1}$]")
-            fig.show()
-        else:
-            fig = plt.figure()
-            ax1 = fig.gca()
-            im1 = ax1.imshow(self.vel, cmap="RdBu", norm=SymLogNorm(1))
-            ax1.set_ylabel("y [pixels]")
-            ax1.set_xlabel("x [pixels]")
-            ax1.set_title(f"Bulk Velocity Flow {datetime} z={height}Mm")
-            fig.colorbar(im1, ax=ax1, label=r"v [kms$^{-1}$]")
-            fig.show()
+        import matplotlib.pyplot as plt
+
+        height = self._z_rounded
+        datetime = self._datetime_str
+        vel = np.asarray(self.vel, dtype=np.float32)
+
+        if ax is not None and ax.images:
+            im = ax.images[0]
+            im.set_data(vel)
+            im.set_norm(self._velocity_norm())
+            ax.set_title(f"Bulk Velocity Flow {datetime} z={height}Mm")
+            ax.figure.canvas.draw_idle()
+            return
+        with plt.rc_context(_RC_CONTEXT):
+            if frame is None:
+                fig = plt.figure()
+                ax1 = fig.add_subplot(1, 1, 1, projection=self.wcs.low_level_wcs)
+                im1 = ax1.imshow(vel, cmap="RdBu", norm=self._velocity_norm())
+                ax1.set_ylabel("Helioprojective Latitude [arcsec]")
+                ax1.set_xlabel("Helioprojective Longitude [arcsec]")
+                ax1.set_title(f"Bulk Velocity Flow {datetime} z={height}Mm")
+                fig.colorbar(im1, ax=ax1, label=r"v [kms$^{-1}$]")
+                fig.show()
+            else:
+                fig = plt.figure()
+                ax1 = fig.gca()
+                im1 = ax1.imshow(vel, cmap="RdBu", norm=self._velocity_norm())
+                ax1.set_ylabel("y [pixels]")
+                ax1.set_xlabel("x [pixels]")
+                ax1.set_title(f"Bulk Velocity Flow {datetime} z={height}Mm")
+                fig.colorbar(im1, ax=ax1, label=r"v [kms$^{-1}$]")
+                fig.show()
 
-    @plt.rc_context(rc_context_dict)
     def params_map(self, frame: Optional[str] = None) -> None:
         """
         Creates maps of electron number density, electron temperature, and bulk
@@ -470,73 +866,270 @@ class Inversion(InversionSlicingMixin):
             The frame to plot the map in. Default is None therefore uses the WCS
             frame. Other option is "pix" to plot in the pixel frame.
         """
-        height = np.round(self.z, decimals=4)
-        try:
-            datetime = self.header["DATE-AVG"]
-        except KeyError:
-            datetime = self.header["date_obs"] + "T" + self.header["time_obs"]
-        if frame is None:
-            fig = plt.figure()
-            fig.suptitle(f"{datetime} z={np.round(height,3)}Mm")
-            ax1 = fig.add_subplot(1, 3, 1, projection=self.wcs.low_level_wcs)
-            im1 = ax1.imshow(self.ne, cmap="cividis")
-            ax1.set_ylabel("Helioprojective Latitude [arcsec]")
-            ax1.set_xlabel("Helioprojective Longitude [arcsec]")
-            ax1.set_title("Electron Number Density")
-            fig.colorbar(
-                im1,
-                ax=ax1,
-                orientation="vertical",
-                label=r"log$_{10}$n$_{e}$ [cm$^{-3}$]",
-            )
+        import matplotlib.pyplot as plt
 
-            ax2 = fig.add_subplot(1, 3, 2, projection=self.wcs.low_level_wcs)
-            im2 = ax2.imshow(self.temp, cmap="hot")
-            ax2.set_ylabel(" ")
-            ax2.tick_params(axis="y", labelleft=False)
-            ax2.set_xlabel("Helioprojective Longitude [arcsec]")
-            ax2.set_title("Electron Temperature")
-            fig.colorbar(im2, ax=ax2, orientation="vertical", label=r"log$_{10}$T [K]")
-
-            ax3 = fig.add_subplot(1, 3, 3, projection=self.wcs.low_level_wcs)
-            im3 = ax3.imshow(self.vel, cmap="RdBu", norm=SymLogNorm(1))
-            ax3.set_ylabel(" ")
-            ax3.tick_params(axis="y", labelleft=False)
-            ax3.set_xlabel("Helioprojective Longitude [arcsec]")
-            ax3.set_title("Bulk Velocity Flow")
-            fig.colorbar(im3, ax=ax3, orientation="vertical", label=r"v [kms$^{-1}$]")
-            fig.show()
+        height = self._z_rounded
+        if isinstance(height, float):
+            suptitle_height = round(height, 3)
         else:
-            fig = plt.figure()
-            ax1 = fig.add_subplot(1, 3, 1)
-            im1 = ax1.imshow(self.ne, cmap="cividis")
-            ax1.set_ylabel("y [pixels]")
-            ax1.set_xlabel("x [pixels]")
-            ax1.set_title("Electron Number Density")
-            fig.colorbar(
-                im1,
-                ax=ax1,
-                orientation="vertical",
-                label=r"log$_{10}$n$_{e}$ [cm$^{-3}$]",
-            )
+            suptitle_height = np.round(height, 3)
+        datetime = self._datetime_str
+        ne, temp, vel = self._prefetch("ne", "temp", "vel")
+        # float32 is ample for display and halves the bytes pushed through the
+        # colour mapping
+        ne = np.asarray(ne, dtype=np.float32)
+        temp = np.asarray(temp, dtype=np.float32)
+        vel = np.asarray(vel, dtype=np.float32)
+        with plt.rc_context(_RC_CONTEXT):
+            if frame is None:
+                fig = plt.figure()
+                fig.suptitle(f"{datetime} z={suptitle_height}Mm")
+                ax1 = fig.add_subplot(1, 3, 1, projection=self.wcs.low_level_wcs)
+                im1 = ax1.imshow(ne, cmap="cividis")
+                ax1.set_ylabel("Helioprojective Latitude [arcsec]")
+                ax1.set_xlabel("Helioprojective Longitude [arcsec]")
+                ax1.set_title("Electron Number Density")
+                fig.colorbar(
+                    im1,
+                    ax=ax1,
+                    orientation="vertical",
+                    label=r"log$_{10}$n$_{e}$ [cm$^{-3}$]",
+                )
 
-            ax2 = fig.add_subplot(1, 3, 2)
-            im2 = ax2.imshow(self.temp, cmap="hot")
-            ax2.set_yticks([])
-            ax2.set_xlabel("x [pixels]")
-            ax2.set_title("Electron Temperature")
-            fig.colorbar(im2, ax=ax2, orientation="vertical", label=r"log$_{10}$T [K]")
+                ax2 = fig.add_subplot(1, 3, 2, projection=self.wcs.low_level_wcs)
+                im2 = ax2.imshow(temp, cmap="hot")
+                ax2.set_ylabel(" ")
+                ax2.tick_params(axis="y", labelleft=False)
+                ax2.set_xlabel("Helioprojective Longitude [arcsec]")
+                ax2.set_title("Electron Temperature")
+                fig.colorbar(
+                    im2, ax=ax2, orientation="vertical", label=r"log$_{10}$T [K]"
+                )
 
-            ax3 = fig.add_subplot(1, 3, 3)
-            im3 = ax3.imshow(self.vel, cmap="RdBu", norm=SymLogNorm(1))
-            ax3.set_yticks([])
-            ax3.set_xlabel("x [pixels]")
-            ax3.set_title("Bulk Velocity Flow")
-            fig.colorbar(im3, ax=ax3, orientation="vertical", label=r"v [kms$^{-1}$]")
-            fig.show()
+                ax3 = fig.add_subplot(1, 3, 3, projection=self.wcs.low_level_wcs)
+                im3 = ax3.imshow(vel, cmap="RdBu", norm=self._velocity_norm())
+                ax3.set_ylabel(" ")
+                ax3.tick_params(axis="y", labelleft=False)
+                ax3.set_xlabel("Helioprojective Longitude [arcsec]")
+                ax3.set_title("Bulk Velocity Flow")
+                fig.colorbar(
+                    im3, ax=ax3, orientation="vertical", label=r"v [kms$^{-1}$]"
+                )
+                fig.show()
+            else:
+                fig = plt.figure()
+                ax1 = fig.add_subplot(1, 3, 1)
+                im1 = ax1.imshow(ne, cmap="cividis")
+                ax1.set_ylabel("y [pixels]")
+                ax1.set_xlabel("x [pixels]")
+                ax1.set_title("Electron Number Density")
+                fig.colorbar(
+                    im1,
+                    ax=ax1,
+                    orientation="vertical",
+                    label=r"log$_{10}$n$_{e}$ [cm$^{-3}$]",
+                )
+
+                ax2 = fig.add_subplot(1, 3, 2)
+                im2 = ax2.imshow(temp, cmap="hot")
+                ax2.set_yticks([])
+                ax2.set_xlabel("x [pixels]")
+                ax2.set_title("Electron Temperature")
+                fig.colorbar(
+                    im2, ax=ax2, orientation="vertical", label=r"log$_{10}$T [K]"
+                )
+
+                ax3 = fig.add_subplot(1, 3, 3)
+                im3 = ax3.imshow(vel, cmap="RdBu", norm=self._velocity_norm())
+                ax3.set_yticks([])
+                ax3.set_xlabel("x [pixels]")
+                ax3.set_title("Bulk Velocity Flow")
+                fig.colorbar(
+                    im3, ax=ax3, orientation="vertical", label=r"v [kms$^{-1}$]"
+                )
+                fig.show()
+
+    def __setattr__(self, name, value) -> None:
+        super().__setattr__(name, value)
+        if name == "wcs":
+            for attr in ("_wcs_ndim", "_wcs_naxis"):
+                self.__dict__.pop(attr, None)
+        if name in ("ind", "wcs"):
+            # the sliced WCS is derived from both so needs recomputing, along
+            # with any coordinates memoised from it
+            for attr in ("_sliced_wcs", "_sliced_ll_wcs") + _WCS_DERIVED:
+                self.__dict__.pop(attr, None)
+
+    @cached_property
+    def _wcs_snapshot(self):
+        """
+        A copy of the parameters of the FITS WCS underlying the sliced WCS,
+        taken when the values derived from it were computed, or ``None`` if
+        there is no FITS WCS to compare against.
+        """
+        base = _fits_wcs(self._sliced_ll_wcs)[0]
+        return None if base is None else deepcopy(base.wcs)
+
+    def _check_wcs(self) -> None:
+        """
+        Drops the values derived from the sliced WCS (e.g. the compiled
+        projection parameters and the memoised coordinates) if the WCS has
+        been modified in place since they were computed.
+        """
+        snapshot = self._wcs_snapshot
+        if snapshot is not None and _fits_wcs(self._sliced_ll_wcs)[0].wcs != snapshot:
+            for attr in _WCS_DERIVED:
+                self.__dict__.pop(attr, None)
+
+    @cached_property
+    def _wcs_ndim(self) -> int:
+        """
+        The number of array dimensions of the WCS.
+        """
+        return len(self.wcs.low_level_wcs.array_shape)
+
+    @cached_property
+    def _wcs_naxis(self) -> int:
+        """
+        The number of axes of the FITS WCS underlying ``self.wcs``.
+        """
+        return self.wcs.low_level_wcs._wcs.naxis
+
+    @cached_property
+    def _sliced_wcs(self):
+        """
+        The WCS restricted to the spatial axes of this object. Slicing the WCS
+        is expensive and the result is the same for every coordinate lookup so
+        it is built once (and rebuilt if ``ind`` or ``wcs`` are reassigned).
+        """
+        wcs_ndim = self._wcs_ndim
+        if wcs_ndim == 2:
+            return self.wcs
+        elif wcs_ndim in (3, 4):
+            if not hasattr(self, "ind"):
+                return self.wcs[(0,) * (wcs_ndim - 2)]
+
+            naxis = self._wcs_naxis
+            ind = self.ind if isinstance(self.ind, (tuple, list)) else (self.ind,)
+            # ind indexes the (z, y, x) data, not the WCS, so a partial index
+            # is completed to three dimensions whatever the number of WCS axes
+            ind = tuple(ind) + (slice(None),) * (3 - len(ind))
+            prefix = (0,) * (naxis - 2)
+            return self.wcs.low_level_wcs._wcs[
+                prefix + (_as_slice(ind[-2]), _as_slice(ind[-1]))
+            ]
+        else:
+            raise NotImplementedError("Too many or too little dimensions.")
+
+    @cached_property
+    def _sliced_ll_wcs(self):
+        """
+        The low-level API of ``_sliced_wcs``, shared by every value based
+        coordinate conversion.
+        """
+        return self._sliced_wcs.low_level_wcs
+
+    @cached_property
+    def _tan_params(self) -> Optional[Tuple[np.ndarray, ...]]:
+        """
+        The projection parameters of the sliced WCS used by the compiled
+        coordinate kernels, or ``None`` if the WCS is not a plain gnomonic
+        projection and astropy has to do the conversion.
+        """
+        return _celestial_tan_params(self._sliced_ll_wcs)
+
+    @cached_property
+    def _world_scale(self) -> Tuple[float, float]:
+        """
+        The factors converting the world values of the sliced WCS to
+        arcseconds.
+        """
+        return tuple(
+            u.Unit(unit).to(u.arcsec) for unit in self._sliced_ll_wcs.world_axis_units
+        )
+
+    def _to_lonlat_tan(self, y, x) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Converts y, x pixel coordinates to Helioprojective Longitude and
+        Latitude values in arcseconds with the compiled TAN kernel.
+        """
+        py, px = np.broadcast_arrays(
+            np.asarray(y, dtype=np.float64), np.asarray(x, dtype=np.float64)
+        )
+        lon, lat = _tan_pix2world(px.ravel(), py.ravel(), *self._tan_params[:3])
+        lon = _wrap_arcsec(lon * 3600).reshape(px.shape)[()]
+        return lon, (lat * 3600).reshape(py.shape)[()]
+
+    def _to_lonlat_wcs(self, y, x) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Converts y, x pixel coordinates to Helioprojective Longitude and
+        Latitude values in arcseconds with the low-level astropy WCS.
+        """
+        lon, lat = self._sliced_ll_wcs.pixel_to_world_values(x, y)
+        lon_scale, lat_scale = self._world_scale
+        return _wrap_arcsec(lon * lon_scale), lat * lat_scale
+
+    def _from_lonlat_tan(self, lon, lat) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Converts Helioprojective Longitude and Latitude values in arcseconds to
+        y, x array indices with the compiled TAN kernel.
+        """
+        crpix, crval, _, cd_inv = self._tan_params
+        lon, lat = np.broadcast_arrays(
+            np.asarray(lon, dtype=np.float64) / 3600,
+            np.asarray(lat, dtype=np.float64) / 3600,
+        )
+        px, py = _tan_world2pix(lon.ravel(), lat.ravel(), crpix, crval, cd_inv)
+        return tuple(
+            np.asarray(np.floor(p.reshape(lon.shape) + 0.5), dtype=int)
+            for p in (py, px)
+        )
+
+    def _from_lonlat_wcs(self, lon, lat) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Converts Helioprojective Longitude and Latitude values in arcseconds to
+        y, x array indices with the low-level astropy WCS.
+        """
+        lon_scale, lat_scale = self._world_scale
+        return self._sliced_ll_wcs.world_to_array_index_values(
+            np.asarray(lon) / lon_scale, np.asarray(lat) / lat_scale
+        )
+
+    @cached_property
+    def _to_lonlat_impl(self) -> Callable:
+        """
+        The pixel to world conversion for the sliced WCS, chosen once rather
+        than on every call.
+        """
+        if self._tan_params is not None:
+            return self._to_lonlat_tan
+        return self._to_lonlat_wcs
+
+    @cached_property
+    def _from_lonlat_impl(self) -> Callable:
+        """
+        The world to pixel conversion for the sliced WCS, chosen once rather
+        than on every call.
+        """
+        if self._tan_params is not None:
+            return self._from_lonlat_tan
+        return self._from_lonlat_wcs
+
+    @cached_property
+    def _lonlat_values(self):
+        """
+        Memoised ``(y, x) -> (Tx, Ty)`` lookup in arcseconds for scalar pixel
+        coordinates, as interactive use tends to query the same pixels many
+        times. The cache is bounded and is dropped with the sliced WCS.
+        """
+        return lru_cache(maxsize=4096)(self._to_lonlat_impl)
 
     def to_lonlat(
-        self, y: int, x: int, coord: bool = False, unit: bool = False
+        self,
+        y: Union[int, np.ndarray],
+        x: Union[int, np.ndarray],
+        coord: bool = False,
+        unit: bool = False,
     ) -> Tuple[float, float]:
         """
         This function will take a y, x coordinate in pixel space and map it to
@@ -544,375 +1137,99 @@ class Inversion(InversionSlicingMixin):
         transform in the WCS. This will return the Helioprojective coordinates
         in units of arcseconds. Note this function takes arguments in the order
         of numpy indexing (y,x) but returns a pair longitude/latitude which is
-        Solar-X, Solar-Y.
+        Solar-X, Solar-Y. Arrays of coordinates are converted in a single WCS
+        transformation.
 
         Parameters
         ----------
-        y : int
-            The y-index to be converted to Helioprojective Latitude.
-        x : int
-            The x-index to be converted to Helioprojective Longitude.
+        y : int or numpy.ndarray
+            The y-index or indices to be converted to Helioprojective Latitude.
+        x : int or numpy.ndarray
+            The x-index or indices to be converted to Helioprojective Longitude.
+        coord : bool, optional
+            Whether or not to return an ``astropy.coordinates.SkyCoord``.
+            Default is False.
+        unit : bool, optional
+            Whether or not to return the values with associated
+            ``astropy.units``. Default is False.
         """
+        if np.ndim(y) > 0 or np.ndim(x) > 0:
+            y, x = np.asarray(y), np.asarray(x)
+        if not (coord or unit):
+            self._check_wcs()
+            # only plain scalars are hashable, 0-d arrays (e.g. from
+            # from_lonlat) skip the memo
+            if isinstance(y, (int, float, np.number)) and isinstance(
+                x, (int, float, np.number)
+            ):
+                return self._lonlat_values(y, x)
+            return self._to_lonlat_impl(y, x)
+        # registers the HPLN/HPLT mapping to the Helioprojective frame
+        import sunpy.coordinates  # noqa: F401
+
+        sc = self._sliced_wcs.array_index_to_world(y, x)
         if coord:
-            if len(self.wcs.low_level_wcs.array_shape) == 4:
-                if hasattr(self, "ind"):
-                    if isinstance(self.ind[-2], slice) and isinstance(
-                        self.ind[-1], slice
-                    ):
-                        return self.wcs.low_level_wcs._wcs[
-                            0, 0, self.ind[-2], self.ind[-1]
-                        ].array_index_to_world(y, x)
-                    elif isinstance(self.ind[-2], slice) and not isinstance(
-                        self.ind[-1], slice
-                    ):
-                        return self.wcs.low_level_wcs._wcs[
-                            0, 0, self.ind[-2]
-                        ].array_index_to_world(y, x)
-                    elif not isinstance(self.ind[-2], slice) and isinstance(
-                        self.ind[-1], slice
-                    ):
-                        return self.wcs.low_level_wcs._wcs[
-                            0, 0, :, self.ind[-1]
-                        ].array_index_to_world(y, x)
-                    else:
-                        return self.wcs.low_level_wcs._wcs[0, 0].array_index_to_world(
-                            y, x
-                        )
-                else:
-                    return self.wcs[0, 0].array_index_to_world(y, x)
-            elif len(self.wcs.low_level_wcs.array_shape) == 3:
-                if hasattr(self, "ind") and self.wcs.low_level_wcs._wcs.naxis == 4:
-                    if isinstance(self.ind[-2], slice) and isinstance(
-                        self.ind[-1], slice
-                    ):
-                        return self.wcs.low_level_wcs._wcs[
-                            0, 0, self.ind[-2], self.ind[-1]
-                        ].array_index_to_world(y, x)
-                    elif isinstance(self.ind[-2], slice) and not isinstance(
-                        self.ind[-1], slice
-                    ):
-                        return self.wcs.low_level_wcs._wcs[
-                            0, 0, self.ind[-2]
-                        ].array_index_to_world(y, x)
-                    elif not isinstance(self.ind[-2], slice) and isinstance(
-                        self.ind[-1], slice
-                    ):
-                        return self.wcs.low_level_wcs._wcs[
-                            0, 0, :, self.ind[-1]
-                        ].array_index_to_world(y, x)
-                    else:
-                        return self.wcs.low_level_wcs._wcs[0, 0].array_index_to_world(
-                            y, x
-                        )
-                else:
-                    if hasattr(self, "ind"):
-                        if isinstance(self.ind[-2], slice) and isinstance(
-                            self.ind[-1], slice
-                        ):
-                            return self.wcs.low_level_wcs._wcs[
-                                0, self.ind[-2], self.ind[-1]
-                            ].array_index_to_world(y, x)
-                        elif isinstance(self.ind[-2], slice) and not isinstance(
-                            self.ind[-1], slice
-                        ):
-                            return self.wcs.low_level_wcs._wcs[
-                                0, self.ind[-2]
-                            ].array_index_to_world(y, x)
-                        elif not isinstance(self.ind[-2], slice) and isinstance(
-                            self.ind[-1], slice
-                        ):
-                            return self.wcs.low_level_wcs._wcs[
-                                0, :, self.ind[-1]
-                            ].array_index_to_world(y, x)
-                        else:
-                            return self.wcs.low_level_wcs._wcs[0].array_index_to_world(
-                                y, x
-                            )
-                    else:
-                        return self.wcs[0].array_index_to_world(y, x)
-            elif len(self.wcs.low_level_wcs.array_shape) == 2:
-                return self.wcs.array_index_to_world(y, x)
-            else:
-                raise NotImplementedError("Too many or too little dimensions.")
-        else:
-            if unit:
-                if len(self.wcs.low_level_wcs.array_shape) == 4:
-                    if hasattr(self, "ind"):
-                        if isinstance(self.ind[-2], slice) and isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, self.ind[-2], self.ind[-1]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx, sc.Ty
-                        elif isinstance(self.ind[-2], slice) and not isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, self.ind[-2]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx, sc.Ty
-                        elif not isinstance(self.ind[-2], slice) and isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, :, self.ind[-1]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx, sc.Ty
-                        else:
-                            sc = self.wcs.low_level_wcs._wcs[0, 0].array_index_to_world(
-                                y, x
-                            )
-                            return sc.Tx, sc.Ty
-                    else:
-                        sc = self.wcs[0, 0].array_index_to_world(y, x)
-                        return sc.Tx, sc.Ty
-                elif len(self.wcs.low_level_wcs.array_shape) == 3:
-                    if hasattr(self, "ind") and self.wcs.low_level_wcs._wcs.naxis == 4:
-                        if isinstance(self.ind[-2], slice) and isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, self.ind[-2], self.ind[-1]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx, sc.Ty
-                        elif isinstance(self.ind[-2], slice) and not isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, self.ind[-2]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx, sc.Ty
-                        elif not isinstance(self.ind[-2], slice) and isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, :, self.ind[-1]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx, sc.Ty
-                        else:
-                            sc = self.wcs.low_level_wcs._wcs[0, 0].array_index_to_world(
-                                y, x
-                            )
-                            return sc.Tx, sc.Ty
-                    else:
-                        if hasattr(self, "ind"):
-                            if isinstance(self.ind[-2], slice) and isinstance(
-                                self.ind[-1], slice
-                            ):
-                                sc = self.wcs.low_level_wcs._wcs[
-                                    0, self.ind[-2], self.ind[-1]
-                                ].array_index_to_world(y, x)
-                                return sc.Tx, sc.Ty
-                            elif isinstance(self.ind[-2], slice) and not isinstance(
-                                self.ind[-1], slice
-                            ):
-                                sc = self.wcs.low_level_wcs._wcs[
-                                    0, self.ind[-2]
-                                ].array_index_to_world(y, x)
-                                return sc.Tx, sc.Ty
-                            elif not isinstance(self.ind[-2], slice) and isinstance(
-                                self.ind[-1], slice
-                            ):
-                                sc = self.wcs.low_level_wcs._wcs[
-                                    0, :, self.ind[-1]
-                                ].array_index_to_world(y, x)
-                                return sc.Tx, sc.Ty
-                            else:
-                                sc = self.wcs.low_level_wcs._wcs[
-                                    0
-                                ].array_index_to_world(y, x)
-                                return sc.Tx, sc.Ty
-                        else:
-                            sc = self.wcs[0].array_index_to_world(y, x)
-                            return sc.Tx, sc.Ty
-                elif len(self.wcs.low_level_wcs.array_shape) == 2:
-                    sc = self.wcs.array_index_to_world(y, x)
-                    return sc.Tx, sc.Ty
-                else:
-                    raise NotImplementedError("Too many or too little dimensions.")
-            else:
-                if len(self.wcs.low_level_wcs.array_shape) == 4:
-                    if hasattr(self, "ind"):
-                        if isinstance(self.ind[-2], slice) and isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, self.ind[-2], self.ind[-1]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx.value, sc.Ty.value
-                        elif isinstance(self.ind[-2], slice) and not isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, self.ind[-2]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx.value, sc.Ty.value
-                        elif not isinstance(self.ind[-2], slice) and isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, :, self.ind[-1]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx.value, sc.Ty.value
-                        else:
-                            sc = self.wcs.low_level_wcs._wcs[0, 0].array_index_to_world(
-                                y, x
-                            )
-                            return sc.Tx.value, sc.Ty.value
-                    else:
-                        sc = self.wcs[0, 0].array_index_to_world(y, x)
-                        return sc.Tx.value, sc.Ty.value
-                elif len(self.wcs.low_level_wcs.array_shape) == 3:
-                    if hasattr(self, "ind") and self.wcs.low_level_wcs._wcs.naxis == 4:
-                        if isinstance(self.ind[-2], slice) and isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, self.ind[-2], self.ind[-1]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx.value, sc.Ty.value
-                        elif isinstance(self.ind[-2], slice) and not isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, self.ind[-2]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx.value, sc.Ty.value
-                        elif not isinstance(self.ind[-2], slice) and isinstance(
-                            self.ind[-1], slice
-                        ):
-                            sc = self.wcs.low_level_wcs._wcs[
-                                0, 0, :, self.ind[-1]
-                            ].array_index_to_world(y, x)
-                            return sc.Tx.value, sc.Ty.value
-                        else:
-                            sc = self.wcs.low_level_wcs._wcs[0, 0].array_index_to_world(
-                                y, x
-                            )
-                            return sc.Tx.value, sc.Ty.value
-                    else:
-                        if hasattr(self, "ind"):
-                            if isinstance(self.ind[-2], slice) and isinstance(
-                                self.ind[-1], slice
-                            ):
-                                sc = self.wcs.low_level_wcs._wcs[
-                                    0, self.ind[-2], self.ind[-1]
-                                ].array_index_to_world(y, x)
-                                return sc.Tx.value, sc.Ty.value
-                            elif isinstance(self.ind[-2], slice) and not isinstance(
-                                self.ind[-1], slice
-                            ):
-                                sc = self.wcs.low_level_wcs._wcs[
-                                    0, self.ind[-2]
-                                ].array_index_to_world(y, x)
-                                return sc.Tx.value, sc.Ty.value
-                            elif not isinstance(self.ind[-2], slice) and isinstance(
-                                self.ind[-1], slice
-                            ):
-                                sc = self.wcs.low_level_wcs._wcs[
-                                    0, :, self.ind[-1]
-                                ].array_index_to_world(y, x)
-                                return sc.Tx.value, sc.Ty.value
-                            else:
-                                sc = self.wcs.low_level_wcs._wcs[
-                                    0
-                                ].array_index_to_world(y, x)
-                                return sc.Tx.value, sc.Ty.value
-                        else:
-                            sc = self.wcs[0].array_index_to_world(y, x)
-                            return sc.Tx.value, sc.Ty.value
-                elif len(self.wcs.low_level_wcs.array_shape) == 2:
-                    sc = self.wcs.array_index_to_world(y, x)
-                    return sc.Tx.value, sc.Ty.value
-                else:
-                    raise NotImplementedError("Too many or too little dimensions.")
-
-    def from_lonlat(self, lon: float, lat: float) -> Tuple[float]:
+            return sc
+        return sc.Tx, sc.Ty
+
+    def to_lonlat_batch(
+        self,
+        ys: Sequence[int],
+        xs: Sequence[int],
+        coord: bool = False,
+        unit: bool = False,
+    ) -> Union[
+        Tuple[np.ndarray, np.ndarray], Tuple[u.Quantity, u.Quantity], "SkyCoord"
+    ]:
+        """
+        Maps arrays of y, x pixel coordinates to Helioprojective Longitude,
+        Helioprojective Latitude. This is equivalent to calling ``to_lonlat``
+        with arrays.
+
+        Parameters
+        ----------
+        ys : numpy.ndarray
+            The y-indices to be converted to Helioprojective Latitude.
+        xs : numpy.ndarray
+            The x-indices to be converted to Helioprojective Longitude.
+        coord : bool, optional
+            Whether or not to return an ``astropy.coordinates.SkyCoord``.
+            Default is False.
+        unit : bool, optional
+            Whether or not to return the values with associated
+            ``astropy.units``. Default is False.
+
+        Returns
+        -------
+        tuple or astropy.coordinates.SkyCoord
+            The Helioprojective Longitudes and Helioprojective Latitudes of the
+            indexed points in arcseconds. These are plain arrays by default,
+            ``astropy.units.Quantity`` arrays if ``unit`` is True or a single
+            ``astropy.coordinates.SkyCoord`` if ``coord`` is True.
+        """
+        return self.to_lonlat(np.asarray(ys), np.asarray(xs), coord=coord, unit=unit)
+
+    def from_lonlat(
+        self, lon: Union[float, np.ndarray], lat: Union[float, np.ndarray]
+    ) -> Tuple[float]:
         """
         This function takes a Helioprojective Longitude, Helioprojective
         Latitude pair and converts them to the y, x indices to index the object
         correctly. The function takes its arguments in the order Helioprojective
         Longitude, Helioprojective Latitude but returns the indices in the (y,x)
         format so that the output of this function can be used to directly index
-        the object.
+        the object. Arrays of coordinates are converted in a single WCS
+        transformation.
 
         Parameters
         ----------
-        lon : float
-            The Helioprojective Longitude in arcseconds.
-        lat : float
-            The Helioprojective Latitude in arcseconds.
-        """
-        lon, lat = lon << u.arcsec, lat << u.arcsec
-        sc = SkyCoord(lon, lat, frame=Helioprojective)
-        if len(self.wcs.low_level_wcs.array_shape) == 4:
-            if hasattr(self, "ind"):
-                if isinstance(self.ind[-2], slice) and isinstance(self.ind[-1], slice):
-                    return self.wcs.low_level_wcs._wcs[
-                        0, 0, self.ind[-2], self.ind[-1]
-                    ].world_to_array_index(sc)
-                elif isinstance(self.ind[-2], slice) and not isinstance(
-                    self.ind[-1], slice
-                ):
-                    return self.wcs.low_level_wcs._wcs[
-                        0, 0, self.ind[-2]
-                    ].world_to_array_index(sc)
-                elif not isinstance(self.ind[-2], slice) and isinstance(
-                    self.ind[-1], slice
-                ):
-                    return self.wcs.low_level_wcs._wcs[
-                        0, 0, :, self.ind[-1]
-                    ].world_to_array_index(sc)
-                else:
-                    return self.wcs.low_level_wcs._wcs[0, 0].world_to_array_index(sc)
-            else:
-                return self.wcs[0, 0].world_to_array_index(lon, lat)
-        elif len(self.wcs.low_level_wcs.array_shape) == 3:
-            if hasattr(self, "ind") and self.wcs.low_level_wcs._wcs.naxis == 4:
-                if isinstance(self.ind[-2], slice) and isinstance(self.ind[-1], slice):
-                    return self.wcs.low_level_wcs._wcs[
-                        0, 0, self.ind[-2], self.ind[-1]
-                    ].world_to_array_index(sc)
-                elif isinstance(self.ind[-2], slice) and not isinstance(
-                    self.ind[-1], slice
-                ):
-                    return self.wcs.low_level_wcs._wcs[
-                        0, 0, self.ind[-2]
-                    ].world_to_array_index(sc)
-                elif not isinstance(self.ind[-2], slice) and isinstance(
-                    self.ind[-1], slice
-                ):
-                    return self.wcs.low_level_wcs._wcs[
-                        0, 0, :, self.ind[-1]
-                    ].world_to_array_index(sc)
-                else:
-                    return self.wcs.low_level_wcs._wcs[0, 0].world_to_array_index(sc)
-            else:
-                if hasattr(self, "ind"):
-                    if isinstance(self.ind[-2], slice) and isinstance(
-                        self.ind[-1], slice
-                    ):
-                        return self.wcs.low_level_wcs._wcs[
-                            0, self.ind[-2], self.ind[-1]
-                        ].world_to_array_index(sc)
-                    elif isinstance(self.ind[-2], slice) and not isinstance(
-                        self.ind[-1], slice
-                    ):
-                        return self.wcs.low_level_wcs._wcs[
-                            0, self.ind[-2]
-                        ].world_to_array_index(sc)
-                    elif not isinstance(self.ind[-2], slice) and isinstance(
-                        self.ind[-1], slice
-                    ):
-                        return self.wcs.low_level_wcs._wcs[
-                            0, :, self.ind[-1]
-                        ].world_to_array_index(sc)
-                    else:
-                        return self.wcs.low_level_wcs._wcs[0].world_to_array_index(sc)
-                else:
-                    return self.wcs[0].world_to_array_index(sc)
-        elif len(self.wcs.low_level_wcs.array_shape) == 2:
-            return self.wcs.world_to_array_index(sc)
-        else:
-            raise NotImplementedError("Too many or too little dimensions.")
+        lon : float or numpy.ndarray
+            The Helioprojective Longitude(s) in arcseconds.
+        lat : float or numpy.ndarray
+            The Helioprojective Latitude(s) in arcseconds.
+        """
+        lon, lat = (
+            c.to_value(u.arcsec) if isinstance(c, u.Quantity) else c for c in (lon, lat)
+        )
+        self._check_wcs()
+        return self._from_lonlat_impl(lon, lat)
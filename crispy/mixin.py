@@ -94,12 +94,12 @@ class InversionSlicingMixin(NDSlicingMixin):
         # else:
         #     err_item = item
         kwargs["filename"] = ObjDict({})
-        kwargs["filename"]["ne"] = self.ne[item]
-        kwargs["filename"]["temperature"] = self.temp[item]
-        kwargs["filename"]["vel"] = self.vel[item]
-        kwargs["filename"]["ne_err"] = self.ne_err[item]
-        kwargs["filename"]["temperature_err"] = self.temp_err[item]
-        kwargs["filename"]["vel_err"] = self.vel_err[item]
+        kwargs["filename"]["ne"] = self._atmos_slice("ne", item)
+        kwargs["filename"]["temperature"] = self._atmos_slice("temp", item)
+        kwargs["filename"]["vel"] = self._atmos_slice("vel", item)
+        kwargs["filename"]["ne_err"] = self._atmos_slice("ne_err", item)
+        kwargs["filename"]["temperature_err"] = self._atmos_slice("temp_err", item)
+        kwargs["filename"]["vel_err"] = self._atmos_slice("vel_err", item)
         kwargs["wcs"] = self._slice_wcs(item)
         if isinstance(item, int):
             kwargs["z"] = self.z[item]